@@ -220,8 +220,7 @@ class ATWhiteLightCsc(salobj.ConfigurableCsc):
                         f"Going to state {self.summary_state!r} but failed to turn off lamp: {e!r}; "
                         "please turn it off manually."
                     )
-            await self.disconnect_lamp()
-            await self.disconnect_chiller()
+            await asyncio.gather(self.disconnect_lamp(), self.disconnect_chiller())
 
     async def connect_chiller(self):
         """Connect to the chiller, configure it and get status.
@@ -268,11 +267,11 @@ class ATWhiteLightCsc(salobj.ConfigurableCsc):
         )
 
     async def disconnect_chiller(self):
+        # Don't use chiller_connected because that can be false
+        # even if a basic connection exists (before status seen)
+        if self.chiller_model is None:
+            return
         try:
-            # Don't use chiller_connected because that can be false
-            # even if a basic connection exists (before status seen)
-            if self.chiller_model is None:
-                return
             await self.chiller_model.disconnect()
             # Delete the chiller model because the config may change.
             self.chiller_model = None
@@ -280,11 +279,11 @@ class ATWhiteLightCsc(salobj.ConfigurableCsc):
             self.log.warning(f"Failed to disconnect chiller; continuing: {e!r}")
 
     async def disconnect_lamp(self):
+        # Don't use self.lamp_connected because that can be false
+        # even if a basic connection exists (before status seen)
+        if self.lamp_model is None:
+            return
         try:
-            # Don't use self.lamp_connected because that can be false
-            # even if a basic connection exists (before status seen)
-            if self.lamp_model is None:
-                return
             await self.lamp_model.disconnect()
             # Delete the lamp model because the config may change.
             self.lamp_model = None
@@ -333,8 +332,7 @@ class ATWhiteLightCsc(salobj.ConfigurableCsc):
         )
 
     async def close_tasks(self):
-        await self.disconnect_chiller()
-        await self.disconnect_lamp()
+        await asyncio.gather(self.disconnect_chiller(), self.disconnect_lamp())
         await super().close_tasks()
 
     async def do_closeShutter(self, data):
@@ -345,13 +343,7 @@ class ATWhiteLightCsc(salobj.ConfigurableCsc):
         data : salobj.BaseMsgType
             Command data; ignored.
         """
-        self.assert_enabled()
-        if not self.lamp_connected:
-            raise salobj.ExpectedError("Lamp not connected")
-        await self.cmd_openShutter.ack_in_progress(
-            data=data, timeout=self.config.lamp.shutter_timeout
-        )
-        await self.lamp_model.move_shutter(do_open=False)
+        await self._move_shutter(data=data, do_open=False)
 
     async def do_openShutter(self, data):
         """Open the shutter.
@@ -361,13 +353,26 @@ class ATWhiteLightCsc(salobj.ConfigurableCsc):
         data : salobj.BaseMsgType
             Command data; ignored.
         """
+        await self._move_shutter(data=data, do_open=True)
+
+    async def _move_shutter(self, data, do_open):
+        """Implement the openShutter and closeShutter commands.
+
+        Parameters
+        ----------
+        data : salobj.BaseMsgType
+            Command data; ignored.
+        do_open : `bool`
+            Specify True to open the shutter, False to close it.
+        """
         self.assert_enabled()
         if not self.lamp_connected:
             raise salobj.ExpectedError("Lamp not connected")
-        await self.cmd_openShutter.ack_in_progress(
+        cmd_topic = self.cmd_openShutter if do_open else self.cmd_closeShutter
+        await cmd_topic.ack_in_progress(
             data=data, timeout=self.config.lamp.shutter_timeout
         )
-        await self.lamp_model.move_shutter(do_open=True)
+        await self.lamp_model.move_shutter(do_open=do_open)
 
     async def do_turnLampOn(self, data):
         """Turn on the lamp.
@@ -72,11 +72,11 @@ class ChillerClient(tcpip.Client):
         full_cmd = self.format_full_command(cmd).encode("ascii")
 
         async with self.communication_lock:
-            self.log.debug(f"Run chiller command {full_cmd}")
+            self.log.debug("Run chiller command %s", full_cmd)
             await self.write(full_cmd)
             reply = await self.readuntil(separator=b"\r")
-        self.log.debug(f"Read chiller reply {reply}")
-        return reply.decode()[:-3]
+        self.log.debug("Read chiller reply %s", reply)
+        return reply[:-3].decode()
 
     def format_full_command(self, cmd):
         r"""Generate a full command with device ID and checksum.
@@ -126,8 +126,7 @@ class ChillerClient(tcpip.Client):
         UnicodeEncodeError
             If st contains any non-ASCII characters.
         """
-        # Check that the string is pure ASCII
-        st.encode("ascii", errors="strict")
-        # Compute the checksum
-        total = sum(ord(ch) for ch in st)
-        return hex(total)[-2:]
+        # Encoding checks that the string is pure ASCII,
+        # and summing bytes avoids a per-character ord() call.
+        total = sum(st.encode("ascii", errors="strict"))
+        return format(total & 0xFF, "02x")
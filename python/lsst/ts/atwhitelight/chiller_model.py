@@ -182,6 +182,7 @@ class ChillerModel:
         self.mock_chiller = None
         self.watchdog_task = utils.make_done_future()
         self.telemetry_task = utils.make_done_future()
+        self.disconnect_task = utils.make_done_future()
 
         # Set when connected and watchdog data has been seen.
         # Cleared when disconnected.
@@ -266,6 +267,18 @@ class ChillerModel:
             await self.csc.evt_chillerConnected.set_write(connected=False)
             self.watchdog_task.cancel()
             self.telemetry_task.cancel()
+            # Wait for both loops to finish (in parallel), so neither
+            # uses the client after it is closed. Skip the current task,
+            # in case this is called from one of the loops.
+            current_task = asyncio.current_task()
+            await asyncio.gather(
+                *[
+                    task
+                    for task in (self.watchdog_task, self.telemetry_task)
+                    if task is not current_task
+                ],
+                return_exceptions=True,
+            )
             self.reset_seen()
             if self.client is not None:
                 await self.client.close()
@@ -285,6 +298,16 @@ class ChillerModel:
         except Exception:
             self.log.exception("status callback failed")
 
+    def start_disconnect(self):
+        """Start disconnecting in the background, unless already doing so.
+
+        Intended for the background loops, which cannot await `disconnect`
+        because it cancels them. Both loops may fail at about the same time,
+        so only one disconnect task is started.
+        """
+        if self.disconnect_task.done():
+            self.disconnect_task = asyncio.create_task(self.disconnect())
+
     def check_set_temperature(self, temperature):
         """Check a demand temperature to see if it is range.
 
@@ -324,7 +347,7 @@ class ChillerModel:
         if fan_num not in FAN_NUMBERS:
             raise ValueError(f"fan_num={fan_num} must be in {FAN_NUMBERS}")
         cmd_num = fan_num + 49
-        await self.run_command(str(cmd_num) + "rFanSpd" + str(fan_num))
+        await self.run_command(f"{cmd_num}rFanSpd{fan_num}")
 
     async def do_read_l1_alarms(self):
         """Read the level 1 alarm state"""
@@ -348,7 +371,7 @@ class ChillerModel:
         await self.run_command("09rProsFlo")
 
     async def do_read_return_temperature(self):
-        """Request await self.run_command(temperature, in C"""
+        """Request return temperature, in C"""
         await self.run_command("07rReturnT")
 
     async def do_read_set_temperature(self):
@@ -416,7 +439,7 @@ class ChillerModel:
             value, scale=10, nchar=5, signed=True
         )
 
-        await self.run_command(cmd_str + formatted_value)
+        await self.run_command(f"{cmd_str}{formatted_value}")
 
     async def do_set_chiller_status(self, status):
         """Set the chiller status.
@@ -451,7 +474,7 @@ class ChillerModel:
         """
         self.check_set_temperature(temperature)
         data = format_chiller_command_value(temperature, scale=10, nchar=5, signed=True)
-        await self.run_command("17sCtrlTmp" + data)
+        await self.run_command(f"17sCtrlTmp{data}")
 
     async def do_set_warning_threshold(self, threshold_type, value):
         """Set a warning threshold for coolant flow rate, or one of several
@@ -486,7 +509,7 @@ class ChillerModel:
             value, scale=10, nchar=5, signed=True
         )
 
-        await self.run_command(cmd_str + formatted_value)
+        await self.run_command(f"{cmd_str}{formatted_value}")
 
     async def do_watchdog(self):
         """Request a watchdog packet"""
@@ -789,8 +812,12 @@ class ChillerModel:
             If the chiller is not connected.
 
         RuntimeError
-            If the chiller rejects the command,
-            or a reply is not seen in time.
+            If the chiller rejects the command.
+
+        asyncio.TimeoutError
+            If sending the command and reading its reply, including waiting
+            for earlier commands to finish, takes longer than
+            ``config.command_timeout`` seconds.
 
         Exception
             If the reply handler raises an exception.
@@ -854,8 +881,7 @@ class ChillerModel:
             self.log.debug("telemetry_loop ends")
         except Exception:
             self.log.exception("telemetry_loop failed")
-            # Don't await disconnect because it cancels this loop
-            asyncio.create_task(self.disconnect())
+            self.start_disconnect()
 
     async def watchdog_loop(self):
         """Run a watchdog command at regular intervals.
@@ -873,5 +899,4 @@ class ChillerModel:
             self.log.debug("watchdog_loop ends")
         except Exception:
             self.log.exception("watchdog_loop failed")
-            # Don't await disconnect because it cancels this loop
-            asyncio.create_task(self.disconnect())
+            self.start_disconnect()
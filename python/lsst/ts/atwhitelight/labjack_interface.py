@@ -85,6 +85,12 @@ class LabJackInterface:
         # handle to LabJack device
         self.handle = None
 
+        # Labels and channel names for `read`, which reads all channels
+        # in a single call. Computed once because `read` is called
+        # at the lamp model's status interval.
+        self._read_labels = tuple(LabJackChannels.read.keys())
+        self._read_channels = list(LabJackChannels.read.values())
+
         # The thread pool executor used by `_run_in_thread`.
         self._thread_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
 
@@ -127,7 +133,7 @@ class LabJackInterface:
         data : `types.SimpleNamespace`
             Struct of label=value, where label is a key in LabjackChannels.read
         """
-        channels = list(LabJackChannels.read.values())
+        channels = self._read_channels
         try:
             values = await self._run_in_thread(
                 func=self._blocking_read,
@@ -140,14 +146,11 @@ class LabJackInterface:
                 f"failed: {e!r}"
             )
             raise
-        if len(values) != len(LabJackChannels.read):
+        if len(values) != len(channels):
             raise RuntimeError(
                 f"The number of read values {values} does not match the number of channels {channels}"
             )
-        channel_dict = {
-            label: value for label, value in zip(LabJackChannels.read.keys(), values)
-        }
-        return types.SimpleNamespace(**channel_dict)
+        return types.SimpleNamespace(**dict(zip(self._read_labels, values)))
 
     async def write(self, **kwargs):
         """Write to one or more labelled channels.
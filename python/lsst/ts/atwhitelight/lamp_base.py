@@ -154,7 +154,7 @@ def voltage_from_power(power):
     if power == 0:
         return 0
 
-    if power < MIN_POWER or power > MAX_POWER:
+    if not MIN_POWER <= power <= MAX_POWER:
         raise salobj.ExpectedError(
             f"{power} must be in range [{MIN_POWER}, {MAX_POWER}], inclusive"
         )
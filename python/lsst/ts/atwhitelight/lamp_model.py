@@ -23,6 +23,7 @@ __all__ = ["LampModel"]
 
 import asyncio
 import inspect
+import time
 
 from lsst.ts import salobj, utils
 from lsst.ts.idl.enums.ATWhiteLight import (
@@ -64,6 +65,15 @@ ONOFF_COMMAND_TIMEOUT_MARGIN = 2
 # as to whether the lamp has been commanded on.
 LAMP_SET_VOLTAGE_ON_THRESHOLD = VOLTS_AT_MIN_POWER - 0.1
 
+# Shutter state as a function of the shutter sensing switches:
+# dict of (closed switch active, open switch active): ShutterState
+SHUTTER_STATE_FROM_SWITCHES = {
+    (False, False): ShutterState.UNKNOWN,
+    (True, False): ShutterState.CLOSED,
+    (False, True): ShutterState.OPEN,
+    (True, True): ShutterState.INVALID,
+}
+
 
 def offset_timestamp(timestamp, offset):
     """Return timestamp if 0, else timestamp + offset.
@@ -132,10 +142,10 @@ class LampModel:
             raise TypeError(
                 f"status_callback={status_callback} must be None or a coroutine"
             )
-        if config.default_power < 800 or config.default_power > 1200:
+        if not MIN_POWER <= config.default_power <= MAX_POWER:
             raise ValueError(
                 f"config.lamp.default_power={config.default_power} must be "
-                "in range [800, 1200], inclusive."
+                f"in range [{MIN_POWER}, {MAX_POWER}], inclusive."
             )
 
         self.config = config
@@ -190,14 +200,15 @@ class LampModel:
 
         # Was the blinking error signal on last time status was read?
         self.blinking_error_was_on = False
-        # Time at which the blinking error signal
+        # Time (monotonic seconds) at which the blinking error signal
         # most recently switched from off to on
         self.blinking_error_on_time = 0
-        # Time at which the blinking error signal
+        # Time (monotonic seconds) at which the blinking error signal
         # most recently switched from on to off
         self.blinking_error_off_time = 0
-        # Time at which the blinking error signal started blinking;
-        # reset after the blinking stops and the error code has been read.
+        # Time (monotonic seconds) at which the blinking error signal
+        # started blinking; reset after the blinking stops
+        # and the error code has been read.
         self.error_code_start_time = 0
 
         # Events for the switches that detect that the shutter
@@ -326,6 +337,9 @@ class LampModel:
         self.abort_lamp_off_future("Disconnecting from the lamp controller")
         if cancel_status_loop:
             self.status_task.cancel()
+            # Wait for the status loop to actually end, so it cannot
+            # read from the LabJack while we disconnect from it.
+            await asyncio.gather(self.status_task, return_exceptions=True)
             self.status_event.clear()
         await self.labjack.disconnect()
         await self.set_status(
@@ -346,7 +360,9 @@ class LampModel:
             while True:
                 async with self.change_power_lock:
                     data = await self.labjack.read()
-                current_tai = utils.current_tai()
+                # Use a monotonic clock for timing the blinking error signal;
+                # only intervals matter and they must not jump.
+                now = time.monotonic()
                 if data.error_exists:
                     # Try to decode the blinking error
                     if self.csc.evt_lampState.has_data:
@@ -355,15 +371,15 @@ class LampModel:
                         controller_error = LampControllerError.NONE
                     if data.blinking_error:
                         if not self.blinking_error_was_on:
-                            self.blinking_error_on_time = current_tai
+                            self.blinking_error_on_time = now
                             if (
                                 self.blinking_error_gap_seen
-                                and current_tai - self.blinking_error_off_time
+                                and now - self.blinking_error_off_time
                                 > ERROR_BLINKING_DURATION
                             ):
                                 self.log.debug("Blinking error signal has started")
                                 # Blinking error is starting to report a code
-                                self.error_code_start_time = current_tai
+                                self.error_code_start_time = now
 
                         if (
                             self.status_event.is_set()
@@ -375,9 +391,9 @@ class LampModel:
                             controller_error = LampControllerError.UNKNOWN
                     else:
                         if self.blinking_error_was_on:
-                            self.blinking_error_off_time = current_tai
+                            self.blinking_error_off_time = now
                         else:
-                            off_duration = current_tai - self.blinking_error_off_time
+                            off_duration = now - self.blinking_error_off_time
                             if off_duration < ERROR_BLINKING_DURATION:
                                 # Blinking error may still be reporting a code
                                 pass
@@ -436,12 +452,9 @@ class LampModel:
                     # and the LabJack is broken.
                     controller_state = LampControllerState.UNKNOWN
 
-                shutter_state = {
-                    (False, False): ShutterState.UNKNOWN,
-                    (True, False): ShutterState.CLOSED,
-                    (False, True): ShutterState.OPEN,
-                    (True, True): ShutterState.INVALID,
-                }[(bool(data.shutter_closed), bool(data.shutter_open))]
+                shutter_state = SHUTTER_STATE_FROM_SWITCHES[
+                    (bool(data.shutter_closed), bool(data.shutter_open))
+                ]
                 light_detected = data.photosensor > self.config.photo_sensor_on_voltage
                 # If light is detected, we set the event.
                 if light_detected:
@@ -504,7 +517,7 @@ class LampModel:
         if not self.connected:
             controller_error = LampControllerError.UNKNOWN
             controller_state = LampControllerState.UNKNOWN
-            if self.get_remaining_cooldown() > 0:
+            if self.get_remaining_cooldown(tai=current_tai) > 0:
                 basic_state = LampBasicState.COOLDOWN
             else:
                 basic_state = LampBasicState.UNKNOWN
@@ -555,7 +568,7 @@ class LampModel:
                         # Still waiting for the photo sensor
                         # to show a signal.
                         basic_state = LampBasicState.TURNING_ON
-                elif self.get_remaining_warmup() > 0:
+                elif self.get_remaining_warmup(tai=current_tai) > 0:
                     basic_state = LampBasicState.WARMUP
                 else:
                     basic_state = LampBasicState.ON
@@ -575,7 +588,7 @@ class LampModel:
                         # Still waiting for the photo sensor
                         # to stop showing a signal.
                         basic_state = LampBasicState.TURNING_OFF
-                elif self.get_remaining_cooldown() > 0:
+                elif self.get_remaining_cooldown(tai=current_tai) > 0:
                     basic_state = LampBasicState.COOLDOWN
                 else:
                     basic_state = LampBasicState.OFF
@@ -618,7 +631,9 @@ class LampModel:
             self.abort_lamp_off_future("Lost connection to the lamp controller")
 
         # Turn off the lamp controller if the bulb is unexpectedly off.
-        if self.lamp_unexpectedly_off and self.connected:
+        # Only write if the lamp is still commanded on, to avoid
+        # rewriting 0 (and waiting READ_POWER_DELAY) on every status read.
+        if self.lamp_unexpectedly_off and lamp_commanded_on and self.connected:
             await self._set_lamp_power(0)
 
         if on_seconds > 0:
@@ -743,7 +758,7 @@ class LampModel:
             # Note: we cannot simply wait for the existing task to finish,
             # because the new power may not match the old one.
             raise salobj.ExpectedError("Already turning the lamp on.")
-        if power < MIN_POWER or power > MAX_POWER:
+        if not MIN_POWER <= power <= MAX_POWER:
             raise salobj.ExpectedError(
                 f"{power} must be in range [{MIN_POWER}, {MAX_POWER}], inclusive"
             )
@@ -808,8 +823,7 @@ class LampModel:
             await self.lamp_off_future
             return
 
-        on_duration = utils.current_tai() - self.lamp_on_time
-        remaining_warmup_duration = self.config.warmup_period - on_duration
+        remaining_warmup_duration = self.get_remaining_warmup()
         if remaining_warmup_duration > 0:
             if force:
                 self.log.warning(
@@ -824,9 +838,12 @@ class LampModel:
 
         self.lamp_unexpectedly_off = False
         self.abort_lamp_on_future(reason)
-        self.lamp_off_future = asyncio.Future()
+        self.lamp_off_future = asyncio.get_running_loop().create_future()
         self.light_detected_event.clear()
-        await self._set_lamp_power(0)
+        # Shield the write so that cancelling the caller (e.g. a timed-out
+        # turnLampOff command) cannot leave the lamp on with the
+        # lamp-off state already set up.
+        await asyncio.shield(self._set_lamp_power(0))
         if wait:
             await asyncio.wait_for(
                 self.lamp_off_future,
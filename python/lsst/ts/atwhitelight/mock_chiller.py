@@ -36,6 +36,7 @@ class MockChiller(tcpip.OneClientServer):
 
     def __init__(self, log):
         self.command_task = utils.make_done_future()
+        self.close_client_task = utils.make_done_future()
 
         # dict of cmd_id: async handler
         # each handler accepts the command data as a string
@@ -130,7 +131,6 @@ class MockChiller(tcpip.OneClientServer):
                     # echo command
                     data = command_data
                 reply = reply_body + data
-                reply = reply_body + data
                 checksum = ChillerClient.compute_checksum(reply)
                 encoded_reply = f"{reply}{checksum}\r".encode()
                 await self.write(encoded_reply)
@@ -139,10 +139,10 @@ class MockChiller(tcpip.OneClientServer):
             raise
         except (ConnectionError, asyncio.IncompleteReadError):
             self.log.error("Socket closed")
-            asyncio.create_task(self.close_client())
+            self.close_client_task = asyncio.create_task(self.close_client())
         except Exception:
             self.log.exception("command_loop failed")
-            asyncio.create_task(self.close_client())
+            self.close_client_task = asyncio.create_task(self.close_client())
 
         self.log.info("command_loop ends")
 
@@ -156,7 +156,9 @@ class MockChiller(tcpip.OneClientServer):
         """
         ret = f"{value:0{ndig}X}"[::-1]
         if len(ret) > ndig:
-            self.log.warning(f"truncating {name}={ret} to {ndig} chars; value={value}")
+            self.log.warning(
+                "truncating %s=%s to %s chars; value=%s", name, ret, ndig, value
+            )
         return ret
 
     async def handle_read_control_temperature(self, data):
@@ -225,7 +227,7 @@ class MockChiller(tcpip.OneClientServer):
             self.pump_running = True
         else:
             self.log.warning(
-                f"Unrecognized chiller state: {data}; leaving state unchanged"
+                "Unrecognized chiller state: %s; leaving state unchanged", data
             )
 
         return data
@@ -22,6 +22,7 @@
 __all__ = ["MockLabJackInterface"]
 
 import asyncio
+import time
 
 from lsst.ts import utils
 from lsst.ts.idl.enums.ATWhiteLight import LampControllerError
@@ -66,6 +67,10 @@ LAMP_OFF_VOLTAGE = 0.05
 # Must be more than the LampModel's config.photo_sensor_on_voltage.
 LAMP_ON_VOLTAGE = 0.8
 
+# Decode the shutter_direction and shutter_enable output values
+DO_OPEN_FROM_SHUTTER_DIRECTION = {SHUTTER_OPEN: True, SHUTTER_CLOSE: False}
+DO_ENABLE_FROM_SHUTTER_ENABLE = {SHUTTER_ENABLE: True, SHUTTER_DISABLE: False}
+
 
 class MockLabJackInterface(LabJackInterface):
     """Mock version of LabJackInterface.
@@ -129,8 +134,8 @@ class MockLabJackInterface(LabJackInterface):
         self.allow_photosensor_on = True
         self.allow_photosensor_off = True
 
-        # Most recent time (TAI unix sec) at which the lamp was
-        # turned off or on.
+        # Most recent time (monotonic seconds) at which the lamp was
+        # turned off or on. Only used to compute durations.
         self.lamp_off_time = 0
         self.lamp_on_time = 0
 
@@ -152,7 +157,7 @@ class MockLabJackInterface(LabJackInterface):
         data.standby_or_on = False
         data.cooldown = False
         if self.lamp_set_voltage == 0:
-            off_duration = utils.current_tai() - self.lamp_off_time
+            off_duration = time.monotonic() - self.lamp_off_time
             if off_duration > self.cooldown_duration:
                 data.standby_or_on = True
             else:
@@ -161,7 +166,7 @@ class MockLabJackInterface(LabJackInterface):
                 self.photosensor = LAMP_OFF_VOLTAGE
         else:
             data.standby_or_on = True
-            on_duration = utils.current_tai() - self.lamp_on_time
+            on_duration = time.monotonic() - self.lamp_on_time
             if on_duration > LAMP_ON_DELAY and self.allow_photosensor_on:
                 self.photosensor = LAMP_ON_VOLTAGE
         data.photosensor = self.photosensor
@@ -181,7 +186,7 @@ class MockLabJackInterface(LabJackInterface):
         if lamp_set_voltage is not None:
             if lamp_set_voltage == 0:
                 if self.lamp_set_voltage > 0:
-                    self.lamp_off_time = utils.current_tai()
+                    self.lamp_off_time = time.monotonic()
             else:
                 if (
                     lamp_set_voltage < VOLTS_AT_MIN_POWER
@@ -192,22 +197,18 @@ class MockLabJackInterface(LabJackInterface):
                         f"[{VOLTS_AT_MIN_POWER}, {VOLTS_AT_MAX_POWER}] V"
                     )
                 if self.lamp_set_voltage == 0:
-                    self.lamp_on_time = utils.current_tai()
+                    self.lamp_on_time = time.monotonic()
             self.lamp_set_voltage = lamp_set_voltage
 
         shutter_direction = kwargs.get("shutter_direction")
         if shutter_direction is not None:
-            self.do_open_shutter = {SHUTTER_OPEN: True, SHUTTER_CLOSE: False}[
-                shutter_direction
-            ]
+            self.do_open_shutter = DO_OPEN_FROM_SHUTTER_DIRECTION[shutter_direction]
 
         shutter_enable = kwargs.get("shutter_enable")
         if shutter_enable is not None:
             self.move_shutter_task.cancel()
             self.shutter_enabled = shutter_enable
-            do_enable_shutter = {SHUTTER_ENABLE: True, SHUTTER_DISABLE: False}[
-                shutter_enable
-            ]
+            do_enable_shutter = DO_ENABLE_FROM_SHUTTER_ENABLE[shutter_enable]
             if do_enable_shutter:
                 self.move_shutter_task = asyncio.create_task(self.move_shutter())
 
@@ -0,0 +1,45 @@
+# This file is part of ts_atwhitelight.
+#
+# Developed for the Vera C. Rubin Observatory Telescope and Site Systems.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import unittest
+
+import pytest
+from lsst.ts import atwhitelight
+
+
+class ChillerClientTestCase(unittest.TestCase):
+    def test_compute_checksum(self):
+        # Checksums are the low byte of the sum of the character codes,
+        # as two lowercase hex digits.
+        for st, expected_checksum in (
+            (".0101WatchDog", "01"),  # sum = 0x401
+            (".0103rSetTemp", "26"),  # sum = 0x426
+            ("\x05", "05"),  # sum < 0x10
+            ("", "00"),
+        ):
+            with self.subTest(st=st):
+                assert (
+                    atwhitelight.ChillerClient.compute_checksum(st)
+                    == expected_checksum
+                )
+
+        with pytest.raises(UnicodeEncodeError):
+            atwhitelight.ChillerClient.compute_checksum(".01°")
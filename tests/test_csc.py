@@ -28,6 +28,7 @@ import pytest
 from lsst.ts import atwhitelight, salobj
 from lsst.ts.atwhitelight import ErrorCode
 from lsst.ts.atwhitelight.chiller_model import READ_RETURN_TEMPERATURE
+from lsst.ts.atwhitelight.mock_labjack_interface import LAMP_OFF_VOLTAGE
 from lsst.ts.idl.enums.ATWhiteLight import (
     ChillerControllerState,
     LampBasicState,
@@ -889,6 +890,50 @@ class CscTestCase(salobj.BaseCscTestCase, unittest.IsolatedAsyncioTestCase):
             # The photo sensor sees no light so the basicState
             # goes directly to COOLDOWN (with no TURNING_OFF phase).
 
+    async def test_lamp_unexpectedly_off(self):
+        """Test that the lamp power is set to 0 once, if the lamp
+        unexpectedly turns off.
+        """
+        async with self.make_csc(
+            initial_state=salobj.State.ENABLED,
+            config_dir=TEST_CONFIG_DIR,
+            simulation_mode=1,
+        ):
+            await self.remote.cmd_startChiller.start()
+            await self.remote.cmd_turnLampOn.start()
+
+            # Record lamp power writes from now on
+            labjack = self.csc.lamp_model.labjack
+            lamp_set_voltages = []
+            original_write = labjack.write
+
+            async def recording_write(**kwargs):
+                if "lamp_set_voltage" in kwargs:
+                    lamp_set_voltages.append(kwargs["lamp_set_voltage"])
+                await original_write(**kwargs)
+
+            labjack.write = recording_write
+
+            # Simulate the bulb burning out
+            labjack.allow_photosensor_on = False
+            labjack.photosensor = LAMP_OFF_VOLTAGE
+            while True:
+                data = await self.remote.evt_lampState.next(
+                    flush=False, timeout=STD_TIMEOUT
+                )
+                if data.basicState == LampBasicState.UNEXPECTEDLY_OFF:
+                    break
+
+            # Let the status loop read the status many more times;
+            # the lamp should have been turned off exactly once.
+            await asyncio.sleep(atwhitelight.STATUS_INTERVAL * 10)
+            assert lamp_set_voltages == [0]
+            assert self.csc.summary_state == salobj.State.FAULT
+            assert (
+                self.csc.evt_errorCode.data.errorCode
+                == ErrorCode.LAMP_UNEXPECTEDLY_OFF
+            )
+
     async def test_reconnect(self):
         async with self.make_csc(
             initial_state=salobj.State.STANDBY,
@@ -1020,8 +1065,13 @@ class CscTestCase(salobj.BaseCscTestCase, unittest.IsolatedAsyncioTestCase):
                 enabled=False,
             )
 
-            # Close the shutter
-            await self.remote.cmd_closeShutter.start()
+            # Close the shutter; check that the command is acknowledged
+            # as in progress, with the shutter timeout, on its own topic.
+            ackcmd = await self.remote.cmd_closeShutter.start(wait_done=False)
+            assert ackcmd.ack == salobj.SalRetCode.CMD_INPROGRESS
+            assert ackcmd.timeout == pytest.approx(
+                self.csc.config.lamp.shutter_timeout
+            )
             await self.assert_next_sample(
                 topic=self.remote.evt_shutterState,
                 commandedState=ShutterState.CLOSED,
@@ -1045,6 +1095,8 @@ class CscTestCase(salobj.BaseCscTestCase, unittest.IsolatedAsyncioTestCase):
                 actualState=ShutterState.CLOSED,
                 enabled=False,
             )
+            ackcmd = await self.remote.cmd_closeShutter.next_ackcmd(ackcmd)
+            assert ackcmd.ack == salobj.SalRetCode.CMD_COMPLETE
 
             # Timeout
             self.csc.lamp_model.labjack.shutter_duration = (
@@ -64,6 +64,8 @@ class LampBaseTestCase(unittest.TestCase):
                     atwhitelight.voltage_from_power(bad_power)
         with pytest.raises(salobj.ExpectedError):
             atwhitelight.voltage_from_power(atwhitelight.MAX_POWER + margin)
+        with pytest.raises(salobj.ExpectedError):
+            atwhitelight.voltage_from_power(float("nan"))
 
         # Test out of range voltage; use atol slightly smaller than margin
         # to provide safety from roundoff error.